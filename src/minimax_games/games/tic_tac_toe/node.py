@@ -15,6 +15,20 @@ class Player(Enum):
 Move = tuple[int, int]
 
 
+# 9-bit board masks, bit r * 3 + c for row r, column c.
+FULL_BOARD = 0b111111111
+WIN_PATTERNS = (
+    0b000000111,  # rows
+    0b000111000,
+    0b111000000,
+    0b001001001,  # columns
+    0b010010010,
+    0b100100100,
+    0b100010001,  # diagonals
+    0b001010100,
+)
+
+
 class Board:
     @classmethod
     def from_string(
@@ -25,22 +39,27 @@ class Board:
     ) -> Board:
         state = "." * 9 if string is None else string
         state = state.lower()
-        b: list[list[Player | None]] = []
-        for r in range(3):
-            b.append([])
-            for c in range(3):
-                ch = state[r * 3 + c]
-                b[-1].append(Player(ch) if ch != "." else None)
-        return cls(b, player=player, depth=depth)
+        xbits = 0
+        obits = 0
+        for i, ch in enumerate(state):
+            if ch == Player.X.value:
+                xbits |= 1 << i
+            elif ch == Player.O.value:
+                obits |= 1 << i
+            elif ch != ".":
+                raise ValueError(f"{ch!r} is not a valid Player")
+        return cls(xbits=xbits, obits=obits, player=player, depth=depth)
 
     def __init__(
         self,
-        state: list[list[Player | None]],
+        xbits: int,
+        obits: int,
         player: Player,
         moves: list[Move] | None = None,
         depth: int = 0,
     ):
-        self.board = state
+        self.xbits = xbits
+        self.obits = obits
         self.player = player
         self.moves: list[Move] = [] if moves is None else moves
         self.depth = depth
@@ -68,49 +87,46 @@ class Board:
 
     def string(self) -> str:
         s = f"{self.player} to play ...\n"
-        for row in self.board:
-            for val in row:
-                s += "." if val is None else val.value
-            s += "\n"
+        for i in range(9):
+            b = 1 << i
+            if self.xbits & b:
+                s += Player.X.value
+            elif self.obits & b:
+                s += Player.O.value
+            else:
+                s += "."
+            if i % 3 == 2:
+                s += "\n"
         s += f"{self.score()}\n"
         return s
 
     def move(self, move: Move) -> Board:
         rix, cix = move
-        if self.board[rix][cix]:
-            msg = f"row={rix}, col={cix} is occupied ({self.board[rix][cix]})"
+        b = 1 << (rix * 3 + cix)
+        if (self.xbits | self.obits) & b:
+            occupier = Player.X if self.xbits & b else Player.O
+            msg = f"row={rix}, col={cix} is occupied ({occupier})"
             raise IllegalMove(msg)
-        next_board = [[v for v in row] for row in self.board]
-        next_board[rix][cix] = self.player
+        xbits = self.xbits | b if self.player == Player.X else self.xbits
+        obits = self.obits | b if self.player == Player.O else self.obits
         return Board(
-            state=next_board,
+            xbits=xbits,
+            obits=obits,
             player=self.next_player(),
             moves=self.moves + [move],
             depth=self.depth + 1,
         )
 
     def score(self) -> int:
-        for p in Player:
-            sign = 1 if p == Player.X else -1
-            if any(all(c == p for c in row) for row in self.board):
-                return sign * (10 - self.depth)
-            if any(
-                all(c == p for c in [self.board[i][j] for i in range(3)])
-                for j in range(3)
-            ):
-                return sign * (10 - self.depth)
-            if all(
-                [self.board[0][0] == p, self.board[1][1] == p, self.board[2][2] == p]
-            ):
-                return sign * (10 - self.depth)
-            if all(
-                [self.board[2][0] == p, self.board[1][1] == p, self.board[0][2] == p]
-            ):
-                return sign * (10 - self.depth)
+        for pattern in WIN_PATTERNS:
+            if self.xbits & pattern == pattern:
+                return 10 - self.depth
+            if self.obits & pattern == pattern:
+                return -(10 - self.depth)
         return 0
 
     def is_terminal(self) -> bool:
-        return bool(self.score()) or all(all(row) for row in self.board)
+        return bool(self.score()) or (self.xbits | self.obits) == FULL_BOARD
 
     def next_player(self) -> Player:
         return Player.X if self.player == Player.O else Player.O
@@ -118,10 +134,8 @@ class Board:
     def children(self) -> Iterator[Board]:
         if self.is_terminal():
             return
-        for rix, row in enumerate(self.board):
-            for cix, val in enumerate(row):
-                if val:
-                    continue
-                yield self.move((rix, cix))
-
-
+        occupied = self.xbits | self.obits
+        for i in range(9):
+            if occupied & (1 << i):
+                continue
+            yield self.move((i // 3, i % 3))
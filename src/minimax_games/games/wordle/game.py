@@ -1,8 +1,10 @@
 from __future__ import annotations
 import argparse
+import concurrent.futures
 import logging
+import pathlib
 import random
-from typing import Protocol
+from typing import final, Protocol
 
 from minimax_games.games.wordle.node import (
     evaluate,
@@ -28,6 +30,7 @@ class Scorer(Protocol):
         ...
 
 
+@final
 class AutoScorer:
     def __init__(self, truth: str) -> None:
         self.truth = truth
@@ -36,6 +39,7 @@ class AutoScorer:
         return evaluate(self.truth, guess)
 
 
+@final
 class UserScorer:
     def __call__(self, guess: str) -> str:
         print(f"Guess: {guess}")
@@ -47,9 +51,10 @@ class UserScorer:
             return score
 
 
+@final
 class UserGuesser:
     def __init__(self, vocabulary: list[str]) -> None:
-        self.vocabulary = vocabulary
+        self.vocabulary = frozenset(vocabulary)
 
     def __call__(self, guesses: list[str], scores: list[str]) -> str:
         while True:
@@ -63,9 +68,26 @@ class UserGuesser:
             return guess
 
 
+def _search_child(child: WordleNode) -> WordleNode:
+    return alphabeta(child, a=child.minimum(), b=child.maximum(), soft=True)
+
+
+@final
 class AlphaBetaGuesser:
-    def __init__(self, vocabulary: list[str]) -> None:
+    def __init__(self, vocabulary: list[str], workers: int | None = None) -> None:
         self.vocabulary = vocabulary
+        self.workers = workers
+
+    def _search(self, node: WordleNode) -> WordleNode:
+        if self.workers is None or self.workers < 2 or node.is_terminal():
+            return alphabeta(node, a=node.minimum(), b=node.maximum(), soft=True)
+        # Split the maximising root across processes; each candidate is
+        # searched with a full window, trading sibling cutoffs for cores.
+        best = node.minimum()
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as pool:
+            for result in pool.map(_search_child, node.children()):
+                best = max(best, result)
+        return best
 
     def __call__(self, guesses: list[str], scores: list[str]) -> str:
         if not guesses:
@@ -78,17 +100,15 @@ class AlphaBetaGuesser:
             scores=scores,
             final_only=False,
         )
+        # A single full-depth search: leaves deeper than 4 plies all score
+        # 0, so a shallower pass's principal variation is an arbitrary
+        # tie-break that cannot tighten the window of a deeper pass.
         node = WordleNode(
             moves=[guesses[-1], scores[-1]],
             vocabulary=vocabulary,
             depth=1 + len(guesses) * 2,
         )
-        best_guess = alphabeta(
-            node,
-            a=node.minimum(),
-            b=node.maximum(),
-            soft=True,
-        )
+        best_guess = self._search(node)
         logger.info(
             "best node move=%s moves=%s", best_guess.moves[-2], best_guess.moves
         )
@@ -185,13 +205,13 @@ class WordleArgs:
     def from_argument_parser(cls, cli: argparse.ArgumentParser) -> WordleArgs:
         args = cli.parse_args()
         vocab_path = "words/words.txt" if args.vocabulary is None else args.vocabulary
-        with open(vocab_path) as f:
-            vocabulary = [line.strip().lower() for line in f]
+        raw = pathlib.Path(vocab_path).read_bytes()
+        vocabulary = [line.strip().lower().decode() for line in raw.splitlines()]
         truth = random.choice(vocabulary) if args.truth is None else args.truth
         guesser = (
             UserGuesser(vocabulary=vocabulary)
             if args.interactive_guess
-            else AlphaBetaGuesser(vocabulary)
+            else AlphaBetaGuesser(vocabulary, workers=args.workers)
         )
         scorer = UserScorer() if args.interactive_score else AutoScorer(truth=truth)
         return WordleArgs(
@@ -207,5 +227,6 @@ cli = argparse.ArgumentParser()
 cli.add_argument("--truth")
 cli.add_argument("--vocabulary")
 cli.add_argument("--log-level", default="WARNING")
+cli.add_argument("--workers", type=int)
 cli.add_argument("--interactive-guess", action="store_true")
 cli.add_argument("--interactive-score", action="store_true")
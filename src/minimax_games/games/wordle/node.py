@@ -1,7 +1,10 @@
 from __future__ import annotations
+import collections
 import functools
+import itertools
 import logging
-from typing import Iterator, Protocol, Self
+import math
+from typing import Iterator, Self
 
 
 logger = logging.getLogger(__name__)
@@ -11,58 +14,172 @@ CORRECT_GUESS = "====="
 COMPLETELY_WRONG = "....."
 MINIMUM_NODE = "_____"
 MAXIMUM_NODE = "^^^^^"
+MIN_MAX_NODES = frozenset((MINIMUM_NODE, MAXIMUM_NODE))
+
+# Every possible status string, indexed by its base-3 code
+# (".", "-", "=" are the digits 0, 1, 2; first character most significant).
+SCORE_STRINGS = tuple("".join(s) for s in itertools.product(".-=", repeat=5))
+
+# Score of every status string, indexed by the same base-3 code.
+SCORE_VALUES = tuple(
+    sum({".": 0, "-": 1, "=": 2}[s] for s in sc) for sc in SCORE_STRINGS
+)
+
+
+@functools.cache
+def word_mask(word: str) -> int:
+    """26-bit letter-presence mask; bit b set iff chr(b + 97) is in the word."""
+    mask = 0
+    for c in word:
+        mask |= 1 << (ord(c) - 97)
+    return mask
 
 
 @functools.cache
-def present(aim: str, guess: str, guessc: str, i: int) -> str:
-    if i > 0:
-        count_aimc = len([c for c in aim if c == guessc])
-        count_stats = len([c for c in guess[:i] if c == guessc])
-        if count_aimc <= count_stats:
-            return "."
-    return "-"
+def word_codes(word: str) -> tuple[int, ...]:
+    """Per-position letter codes, 0 for 'a' through 25 for 'z'."""
+    return tuple(ord(c) - 97 for c in word)
 
 
 @functools.cache
+def word_packed(word: str) -> int:
+    """Letter codes packed into one int, 8 bits per position."""
+    packed = 0
+    for i, c in enumerate(word):
+        packed |= (ord(c) - 97) << (8 * i)
+    return packed
+
+
+def _evaluate_codes(aim: tuple[int, ...], guess: tuple[int, ...]) -> int:
+    avail = [0] * 26
+    for b in aim:
+        avail[b] += 1
+    code = 0
+    for ab, gb in zip(aim, guess):
+        if ab == gb:
+            code = code * 3 + 2
+        elif avail[gb] > 0:
+            code = code * 3 + 1
+        else:
+            code = code * 3
+        avail[gb] -= 1
+    return code
+
+
+@functools.cache
+def score_code(sc: str) -> int:
+    """Base-3 code for a status string; inverse of indexing SCORE_STRINGS."""
+    digits = {".": 0, "-": 1, "=": 2}
+    code = 0
+    for s in sc:
+        code = code * 3 + digits[s]
+    return code
+
+
 def evaluate(aim: str, guess: str) -> str:
-    status = ""
-    for i, (aimc, guessc) in enumerate(zip(aim, guess)):
-        if aimc == guessc:
-            status += "="
-        elif guessc in aim:
-            status += present(aim=aim, guess=guess, guessc=guessc, i=i)
+    return SCORE_STRINGS[evaluate_batch_codes([aim], guess)[0]]
+
+
+def evaluate_batch_codes(aims: list[str], guess: str) -> list[int]:
+    """Base-3 codes for one guess against every aim in a single sweep.
+
+    Hoists the guess-side work out of the per-aim loop so the minimising
+    fan-out in `WordleNode.children` does one pass per word rather than a
+    `present` call per character. The packed-word XOR settles the two
+    extreme cases (identical words, no letters in common) without
+    touching the per-position loop.
+    """
+    guess_codes = word_codes(guess)
+    guess_packed = word_packed(guess)
+    guess_mask = word_mask(guess)
+    all_green = score_code(CORRECT_GUESS)
+    codes = []
+    for aim in aims:
+        if not word_packed(aim) ^ guess_packed:
+            codes.append(all_green)
+        elif not word_mask(aim) & guess_mask:
+            codes.append(0)
         else:
-            status += "."
-    return status
+            codes.append(_evaluate_codes(word_codes(aim), guess_codes))
+    return codes
+
+
+def evaluate_batch(aims: list[str], guess: str) -> list[str]:
+    return [SCORE_STRINGS[code] for code in evaluate_batch_codes(aims, guess)]
+
+
+def entropy(guess: str, words: list[str]) -> float:
+    """Expected information gain of a guess over the remaining words."""
+    counts = collections.Counter(evaluate_batch_codes(words, guess))
+    n = len(words)
+    return -sum((c / n) * math.log2(c / n) for c in counts.values())
 
 
 @functools.cache
+def entropy_order(words: tuple[str, ...]) -> tuple[str, ...]:
+    """Guesses sorted by expected information gain, cached per vocabulary.
+
+    The sort costs O(V^2) evaluations, so share it between every node
+    (and every search) that holds the same vocabulary.
+    """
+    vocabulary = list(words)
+    return tuple(
+        sorted(
+            words,
+            key=lambda guess: entropy(guess, vocabulary),
+            reverse=True,
+        )
+    )
+
+
 def score_evaluation(sc: str) -> int:
-    logger.debug("score=%s", sc)
     if sc == MINIMUM_NODE:
         return -100
     if sc == MAXIMUM_NODE:
         return 100
-    scores = {".": 0, "-": 1, "=": 2}
-    return sum(scores[s] for s in sc)
-
+    return SCORE_VALUES[score_code(sc)]
 
-def prune_correct(words: list[str], i: int, c: str) -> list[str]:
-    return [w for w in words if w[i] == c]
 
+# Constraint kinds: letter at position, letter elsewhere, letter absent.
+_CORRECT, _PRESENT, _MISSING = 0, 1, 2
 
-def prune_present(words: list[str], i: int, c: str) -> list[str]:
-    return [w for w in words if c in w and w[i] != c]
+Constraint = tuple[int, int, str, int]
 
 
-def prune_missing(
-    words: list[str], i: int, c: str, status: str, guess: str
-) -> list[str]:
-    # Character with missing may be present elsewhere in the word
-    # return [w for w in words if w[i] != c]
-    if [s for s, c_ in zip(status, guess) if c_ == c and s != "."]:
-        return [w for w in words if c in w and w[i] != c]
-    return [w for w in words if c not in w]
+@functools.cache
+def _pair_constraints(guess: str, score: str) -> tuple[Constraint, ...]:
+    """Parse a (guess, score) pair into (kind, i, c, letter bit) once."""
+    constraints = []
+    for i, (c, s) in enumerate(zip(guess, score)):
+        b = 1 << (ord(c) - 97)
+        match s:
+            case "=":
+                kind = _CORRECT
+            case "-":
+                kind = _PRESENT
+            case ".":
+                # Character with missing may be present elsewhere in the word
+                if [s_ for s_, c_ in zip(score, guess) if c_ == c and s_ != "."]:
+                    kind = _PRESENT
+                else:
+                    kind = _MISSING
+            case _:
+                raise ValueError(f"Unkown evaluation.")
+        constraints.append((kind, i, c, b))
+    return tuple(constraints)
+
+
+def _keep_word(word: str, mask: int, constraints: tuple[Constraint, ...]) -> bool:
+    for kind, i, c, b in constraints:
+        if kind == _CORRECT:
+            if word[i] != c:
+                return False
+        elif kind == _PRESENT:
+            if not mask & b or word[i] == c:
+                return False
+        elif mask & b:
+            return False
+    return True
 
 
 def prune(
@@ -75,70 +192,32 @@ def prune(
         raise ValueError(
             "Pruning with different sizes guesses and scores not supported"
         )
+    pairs = []
     for guess, score in zip(reversed(guesses), reversed(scores)):
         if score == CORRECT_GUESS:
             return [guess]
-        else:
-            words = [w for w in words if w != guess]
-
-        for i, (c, s) in enumerate(zip(guess, score)):
-            match s:
-                case "=":
-                    words = prune_correct(words, i, c)
-                case "-":
-                    words = prune_present(words, i, c)
-                case ".":
-                    words = prune_missing(words, i, c, score, guess)
-                case _:
-                    raise ValueError(f"Unkown evaluation.")
+        pairs.append((guess, _pair_constraints(guess, score)))
         if final_only:
             break
-    return words
-
-
-class Guesser(Protocol):
-    def __call__(self, guesses: list[str], scores: list[str]) -> str:
-        ...
+    kept = []
+    for w in words:
+        mask = word_mask(w)
+        if all(
+            w != guess and _keep_word(w, mask, constraints)
+            for guess, constraints in pairs
+        ):
+            kept.append(w)
+    return kept
 
 
-class Scorer(Protocol):
-    def __call__(self, guess: str) -> str:
-        ...
-
-
-class AutoScorer:
-    def __init__(self, truth: str) -> None:
-        self.truth = truth
-
-    def __call__(self, guess: str) -> str:
-        return evaluate(self.truth, guess)
-
-
-class UserScorer:
-    def __call__(self, guess: str) -> str:
-        print(f"Guess: {guess}")
-        while True:
-            score = input("Score: ").strip().lower()
-            if len(score) != 5:
-                print("Score must be 5 letters long. Enter another.")
-                continue
-            return score
-
-
-class UserGuesser:
-    def __init__(self, vocabulary: list[str]) -> None:
-        self.vocabulary = vocabulary
+@functools.cache
+def _prune_pair(words: tuple[str, ...], guess: str, score: str) -> tuple[str, ...]:
+    """Transposition table for single-pair pruning.
 
-    def __call__(self, guesses: list[str], scores: list[str]) -> str:
-        while True:
-            guess = input("Guess: ").strip().lower()
-            if len(guess) != 5:
-                print("Guess must be 5 letters long. Enter another.")
-                continue
-            if not guess in self.vocabulary:
-                print("Guess not a known word.")
-                continue
-            return guess
+    (words, guess, score) fully determines the pruned vocabulary, and the
+    search revisits the same combination across sibling nodes.
+    """
+    return tuple(prune(words=list(words), guesses=[guess], scores=[score]))
 
 
 class WordleNode:
@@ -177,7 +256,7 @@ class WordleNode:
         return self.score() >= other.score()
 
     def score(self) -> int:
-        min_max_node = self.moves[-1] in [MINIMUM_NODE, MAXIMUM_NODE]
+        min_max_node = self.moves[-1] in MIN_MAX_NODES
         if not self.is_maximising() or min_max_node:
             return score_evaluation(self.moves[-1])
         # And this is the crux
@@ -200,32 +279,38 @@ class WordleNode:
     def children(self) -> Iterator[Self]:
         if self.is_maximising():
             self.prune()
-            for guess in self.vocabulary:
+            # High-entropy guesses split the remaining words most evenly,
+            # so trying them first gives alpha-beta its cutoffs earliest.
+            for guess in entropy_order(tuple(self.vocabulary)):
                 yield WordleNode(
                     moves=self.moves + [guess],
-                    vocabulary=[w for w in self.vocabulary],
+                    vocabulary=self.vocabulary,
                     depth=self.depth + 1,
                 )
         else:
-            # this only needs to be each _evaluation_
-            # multiple words lead to the same evaluation.
-            for guess in self.vocabulary:
-                sc = evaluate(guess=self.moves[-1], aim=guess)
+            # multiple words lead to the same evaluation, and identical
+            # evaluations make identical children, so expand each once.
+            # Work on the integer codes; only the child's move needs a string.
+            seen: set[int] = set()
+            for code in evaluate_batch_codes(
+                aims=self.vocabulary, guess=self.moves[-1]
+            ):
+                if code in seen:
+                    continue
+                seen.add(code)
+                sc = SCORE_STRINGS[code]
                 logger.debug("%s %s", self.moves, sc)
                 yield WordleNode(
                     moves=self.moves + [sc],
-                    vocabulary=[w for w in self.vocabulary],
+                    vocabulary=self.vocabulary,
                     depth=self.depth + 1,
                 )
 
     def prune(self) -> None:
         if len(self.moves) < 2:
             return
-        self.vocabulary = prune(
-            words=self.vocabulary,
-            guesses=self.moves[-2:-1],
-            scores=self.moves[-1:],
-            final_only=True,
+        self.vocabulary = list(
+            _prune_pair(tuple(self.vocabulary), self.moves[-2], self.moves[-1])
         )
 
     def maximum(self) -> WordleNode:
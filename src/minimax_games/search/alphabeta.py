@@ -8,30 +8,53 @@ logger = logging.getLogger(__name__)
 
 def alphabeta(node: Node, a: Node, b: Node, soft: bool = True) -> Node:
     logger.debug("got node=%s a=%s b=%s", node.moves, a.moves, b.moves)
-    if node.is_maximising():
-        logger.debug("got node=%s a=%s b=%s", node.score(), a.score(), b.score())
     if node.is_terminal():
         logger.debug("terminal")
-        logger.debug("returned node=%s a=%s b=%s", node.moves, a.moves, b.moves)
         return node
 
     gt_op = "__ge__" if soft else "__gt__"
     lt_op = "__le__" if soft else "__lt__"
 
-    best_node = node.minimum() if node.is_maximising() else node.maximum()
-
-    for child in node.children():
-        if node.is_maximising():
-            best_node = max(best_node, alphabeta(node=child, a=a, b=b, soft=soft))
-            a = max(a, best_node)
-            if getattr(best_node, gt_op)(b):
-                break
+    def new_frame(node: Node, a: Node, b: Node) -> list:
+        best = node.minimum() if node.is_maximising() else node.maximum()
+        return [node, node.children(), best, a, b]
+
+    # Explicit stack of [node, children, best, a, b] frames instead of
+    # recursion; `result` carries a finished subtree's best node up to
+    # the frame that spawned it.
+    stack = [new_frame(node, a, b)]
+    result: Node | None = None
+    while stack:
+        frame = stack[-1]
+        fnode, children, best, fa, fb = frame
+        if result is not None:
+            if fnode.is_maximising():
+                best = max(best, result)
+                fa = max(fa, best)
+                frame[2], frame[3] = best, fa
+                if getattr(best, gt_op)(fb):
+                    stack.pop()
+                    result = best
+                    continue
+            else:
+                best = min(best, result)
+                fb = min(fb, best)
+                frame[2], frame[4] = best, fb
+                if getattr(best, lt_op)(fa):
+                    stack.pop()
+                    result = best
+                    continue
+            result = None
+        child = next(children, None)
+        if child is None:
+            logger.debug("returned node=%s a=%s b=%s", fnode.moves, fa.moves, fb.moves)
+            stack.pop()
+            result = best
+            continue
+        if child.is_terminal():
+            result = child
         else:
-            best_node = min(best_node, alphabeta(node=child, a=a, b=b, soft=soft))
-            b = min(b, best_node)
-            if getattr(best_node, lt_op)(a):
-                break
-
-    logger.debug("returned node=%s a=%s b=%s", node.moves, a.moves, b.moves)
+            stack.append(new_frame(child, fa, fb))
 
-    return best_node
+    assert result is not None
+    return result